@@ -9,14 +9,19 @@ of multiple trials across a set of SWE-bench instances. It handles:
 
 Typical usage:
     benchmark = Benchmark("my-benchmark", instances, "./results")
-    while result := benchmark.run_next_trial():
-        print(f"Trial completed: {result}")
+    benchmark.run_all_trials(max_workers=4)
 """
 
+import logging
 import os
-import json
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Any
 
+import msgspec
+
 from .swe_bench_instance import SWEBenchInstance
 from .trial import Trial, TrialResult
 
@@ -39,10 +44,13 @@ class Benchmark:
             Directory path where results are stored
     """
 
+    __slots__ = ("name", "instances", "results", "results_dir", "_pending")
+
     name: str
     instances: list[SWEBenchInstance]
     results: dict[str, TrialResult]
     results_dir: str
+    _pending: deque[SWEBenchInstance]
 
     def __init__(self, name: str, instances: list[SWEBenchInstance], results_dir: str):
         """Initialize a new benchmark run.
@@ -64,22 +72,32 @@ class Benchmark:
         self.results_dir = os.path.join(results_dir, name)
         os.makedirs(self.results_dir, exist_ok=True)
 
-        # Load existing results from JSON files
-        for instance_dir in os.listdir(self.results_dir):
-            instance_path = os.path.join(self.results_dir, instance_dir)
-
-            for run_dir in os.listdir(instance_path):
-                run_path = os.path.join(instance_path, run_dir)
-                result_path = os.path.join(run_path, "result.json")
-
-                if os.path.exists(result_path):
-                    run_name = f"{instance_dir}-{run_dir}"
-
-                    data = json.load(open(result_path, "r"))
-                    if "instance" in data:
-                        data["instance"] = SWEBenchInstance(**data["instance"])
-
-                    self.results[run_name] = TrialResult(**data)
+        # Load existing results from JSON files. A single glob walks the
+        # instance/run tree, the raw bytes are read concurrently, and msgspec
+        # decodes each file straight into a typed TrialResult (including the
+        # nested SWEBenchInstance) without an intermediate dict.
+        result_paths = list(Path(self.results_dir).glob("*/*/result.json"))
+
+        if result_paths:
+            with ThreadPoolExecutor() as executor:
+                raw_results = executor.map(
+                    lambda path: (path, path.read_bytes()), result_paths
+                )
+
+                for path, raw in raw_results:
+                    run_name = f"{path.parent.parent.name}-{path.parent.name}"
+                    self.results[run_name] = msgspec.json.decode(
+                        raw, type=TrialResult
+                    )
+
+        # Instances still awaiting their first run, popped as trials complete;
+        # this keeps the benchmark loop O(N) overall instead of rescanning the
+        # full instance list after every finished trial
+        self._pending = deque(
+            instance
+            for instance in instances
+            if f"{instance.instance_id}-1" not in self.results
+        )
 
     def next_run(self) -> dict[str, Any] | None:
         """Find the next instance that needs to be evaluated.
@@ -90,10 +108,16 @@ class Benchmark:
             has the following structure:
             {"instance": SWEBenchInstance, "run": int, "run_name": str}
         """
-        for instance in self.instances:
+        while self._pending:
+            instance = self._pending[0]
             run_name = f"{instance.instance_id}-1"
-            if run_name not in self.results:
-                return {"instance": instance, "run": 1, "run_name": run_name}
+
+            # Lazily drop instances whose result arrived since the last call
+            if run_name in self.results:
+                self._pending.popleft()
+                continue
+
+            return {"instance": instance, "run": 1, "run_name": run_name}
         return None
 
     def run_next_trial(self) -> TrialResult | None:
@@ -115,18 +139,89 @@ class Benchmark:
         if next_run is None:
             return None
 
-        run_name = next_run["run_name"]
-        instance = next_run["instance"]
-        run = next_run["run"]
+        result = self._run_trial(
+            next_run["instance"], next_run["run"], next_run["run_name"]
+        )
+        self.results[next_run["run_name"]] = result
+
+        return result
+
+    def run_all_trials(self, max_workers: int = 4) -> list[TrialResult]:
+        """Execute all pending trials concurrently.
 
+        Trials are fully independent (each runs in its own Docker container),
+        so they are submitted to a thread pool and collected as they complete.
+        The work is I/O-bound (Docker API calls, LLM requests), which makes
+        threads a good fit.
+
+        Args:
+            max_workers: Maximum number of trials to run concurrently
+
+        Returns:
+            The results of all trials executed by this call, in completion order
+        """
+        pending = [
+            {"instance": instance, "run": 1, "run_name": f"{instance.instance_id}-1"}
+            for instance in self._pending
+        ]
+
+        if not pending:
+            return []
+
+        results_lock = threading.Lock()
+        completed: list[TrialResult] = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._run_trial, run["instance"], run["run"], run["run_name"]
+                ): run["run_name"]
+                for run in pending
+            }
+
+            for future in as_completed(futures):
+                run_name = futures[future]
+                # Trial.run() catches its own failures, but construction
+                # (Docker client, makedirs) can still raise; one broken
+                # trial must not abandon the rest of the batch
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logging.error(f"Trial {run_name} failed to run: {e}")
+                    continue
+
+                with results_lock:
+                    self.results[run_name] = result
+
+                completed.append(result)
+                logging.info(
+                    f"Done running trial {result.instance.instance_id}: {result.error or 'Success'}"
+                )
+
+        self._pending.clear()
+
+        return completed
+
+    def _run_trial(
+        self, instance: SWEBenchInstance, run: int, run_name: str
+    ) -> TrialResult:
+        """Execute a single trial and persist its result to disk.
+
+        Args:
+            instance: The SWE-bench instance to evaluate
+            run: The run number for this trial
+            run_name: Unique name identifying this trial run
+
+        Returns:
+            The result of the trial execution
+        """
         run_path = os.path.join(self.results_dir, instance.instance_id, str(run))
         os.makedirs(run_path, exist_ok=True)
 
         trial = Trial(instance, run_name, run_path)
         result = trial.run()
 
-        self.results[run_name] = result
-        with open(os.path.join(run_path, f"result.json"), "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
+        # msgspec encodes the result directly, skipping the dict intermediate
+        Path(run_path, "result.json").write_bytes(msgspec.json.encode(result))
 
         return result
@@ -17,7 +17,12 @@ Typical usage:
     instance.cleanup()
 """
 
+import io
 import logging
+import tarfile
+import threading
+import time
+from collections import deque
 from typing import Self
 import os
 
@@ -29,6 +34,50 @@ import swebench.harness.docker_utils as docker_utils
 
 from .swe_bench_instance import SWEBenchInstance
 
+# Shared Docker client; building one per DockerInstance re-parses the
+# environment and negotiates the API version on every trial. The pool size
+# leaves headroom for trials running concurrently on the thread pool.
+_client: DockerClient | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> DockerClient:
+    """Return the process-wide Docker client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = docker_from_env(max_pool_size=16)
+        return _client
+
+
+# Images confirmed present in the local daemon; checked once per process so
+# repeated trials against the same image skip the images.get round-trip.
+_verified_images: set[str] = set()
+_verified_images_lock = threading.Lock()
+
+
+def _ensure_image(client: DockerClient, image: str) -> None:
+    """Make sure an image is available locally, pulling it if necessary.
+
+    The check result is cached per-process, so only the first trial for a
+    given image pays the Docker API round-trip.
+
+    Args:
+        client: The Docker client to query
+        image: The image tag to verify
+    """
+    with _verified_images_lock:
+        if image in _verified_images:
+            return
+
+    try:
+        client.images.get(image)
+    except ImageNotFound:
+        client.images.pull(image)
+
+    with _verified_images_lock:
+        _verified_images.add(image)
+
 
 class ExecResult:
     """Represents the result of a command execution in a Docker container.
@@ -37,17 +86,31 @@ class ExecResult:
     executed in a Docker container, making it easy to check both the
     result and success status of the command.
 
+    The output is kept as raw bytes; commands can emit megabytes of logs
+    and many callers only need a substring check, so decoding is deferred
+    to the `text` property and memoized.
+
     Attributes:
-        output: The command's stdout/stderr output
+        output: The command's raw stdout/stderr output as bytes
         exit_code: The command's exit code (0 for success)
     """
 
-    output: str
+    __slots__ = ("output", "exit_code", "_text")
+
+    output: bytes
     exit_code: int
 
-    def __init__(self, output: str, exit_code: int) -> None:
+    def __init__(self, output: bytes, exit_code: int) -> None:
         self.output = output
         self.exit_code = exit_code
+        self._text: str | None = None
+
+    @property
+    def text(self) -> str:
+        """The command output decoded as UTF-8, computed once on first access."""
+        if self._text is None:
+            self._text = self.output.decode("utf-8", "replace")
+        return self._text
 
 
 class DockerInstance:
@@ -65,6 +128,16 @@ class DockerInstance:
     all Docker-related operations safely.
     """
 
+    __slots__ = (
+        "client",
+        "instance",
+        "container",
+        "instance_dir",
+        "cache_dir",
+        "log_dir",
+        "_ensured_dirs",
+    )
+
     client: DockerClient
     instance: SWEBenchInstance
     container: Container
@@ -80,9 +153,14 @@ class DockerInstance:
             instance: The SWE-bench instance this container will run
             results_dir: Directory for storing results and artifacts
         """
-        self.client = docker_from_env()
+        self.client = _get_client()
         self.instance = instance
         self.instance_dir = os.path.join(results_dir, "container")
+        os.makedirs(self.instance_dir, exist_ok=True)
+
+        # Container directories already created via mkdir -p, so repeated
+        # writes into the same directory skip the exec round-trip
+        self._ensured_dirs: set[str] = set()
 
         repo = self.instance.repo.replace("/", "_")
         version = self.instance.version
@@ -97,10 +175,9 @@ class DockerInstance:
         """Create and start a Docker container for test execution.
 
         This method:
-        1. Creates the instance directory
-        2. Ensures the required image is available
-        3. Creates and starts the container
-        4. Sets up volume mounts
+        1. Ensures the required image is available
+        2. Creates and starts the container
+        3. Sets up volume mounts
 
         Args:
             run_id: Unique identifier for this container run
@@ -111,27 +188,28 @@ class DockerInstance:
         Raises:
             ImageNotFound: If the required Docker image is not available
         """
-        os.makedirs(self.instance_dir, exist_ok=True)
+        # Compute the derived image and container names once; both are
+        # string-formatting properties that were re-evaluated per use
+        image = self.instance.instance_image_key
+        container_name = self.instance.get_instance_container_name(run_id)
 
-        try:
-            self.client.images.get(self.instance.instance_image_key)
-        except ImageNotFound:
-            self.client.images.pull(self.instance.instance_image_key)
+        _ensure_image(self.client, image)
+
+        # A fresh container starts with none of our directories in place
+        self._ensured_dirs.clear()
 
         logging.info(f"Creating container for {self.instance.instance_id}...")
 
         # Try to clean up any existing container, otherwise ignore
         try:
-            container = self.client.containers.get(
-                self.instance.get_instance_container_name(run_id)
-            )
+            container = self.client.containers.get(container_name)
             container.remove()
         except:  # noqa: E722
             pass
 
         self.container = self.client.containers.create(
-            image=self.instance.instance_image_key,
-            name=self.instance.get_instance_container_name(run_id),
+            image=image,
+            name=container_name,
             user="root",
             detach=True,
             command="tail -f /dev/null",
@@ -170,25 +248,28 @@ class DockerInstance:
     def write_string_to_file(self, string: str, filepath: str) -> None:
         """Write a string to a file in the container.
 
-        This method writes the string to a file in the instance directory
-        and then copies it to the specified location in the container.
+        The content is streamed into the container as an in-memory tar via a
+        single put_archive API call, instead of staging the file on the host
+        and copying it with two exec round-trips.
 
         Args:
             string: Content to write to the file
             filepath: Target path in the container
         """
-        # Write to a temporary file in the instance directory
-        tmp_name = os.path.basename(filepath)
-        src_path = os.path.join(self.instance_dir, tmp_name)
-        os.makedirs(self.instance_dir, exist_ok=True)
+        data = string.encode()
 
-        with open(src_path, "w") as f:
-            f.write(string)
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            info = tarfile.TarInfo(name=os.path.basename(filepath))
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
 
-        # Create target directory and copy file
+        # Make sure the target directory exists, then stream the tar in
         file_dir = os.path.dirname(filepath)
-        self.container.exec_run(f"mkdir -p {file_dir}")
-        self.container.exec_run(f"cp /swe/{tmp_name} {filepath}")
+        if file_dir not in self._ensured_dirs:
+            self.container.exec_run(f"mkdir -p {file_dir}")
+            self._ensured_dirs.add(file_dir)
+        self.container.put_archive(file_dir, buf.getvalue())
 
     def cleanup(self) -> None:
         """Clean up container resources.
@@ -201,14 +282,56 @@ class DockerInstance:
                 self.client, self.container, logger=logging.getLogger()
             )
 
-    def exec(self, command: str, env: dict[str, str] = {}) -> ExecResult:
+    def exec(
+        self,
+        command: str,
+        env: dict[str, str] = {},
+        tail_bytes: int | None = None,
+        timeout: float | None = None,
+    ) -> ExecResult:
         """Execute a command in the container.
 
+        Output is streamed chunk by chunk into an exec log in the log
+        directory instead of letting the Docker SDK buffer it wholesale.
+        When tail_bytes is set, only that many trailing bytes are retained
+        in memory for the returned result; the full output is still on disk.
+
         Args:
             command: The shell command to execute
+            env: Environment variables for the command
+            tail_bytes: Optional cap on the in-memory output tail
+            timeout: Optional deadline in seconds; checked between output
+                chunks, so it is effective for commands that keep logging
 
         Returns:
             ExecResult: Object containing the command's output and exit code
+
+        Raises:
+            TimeoutError: If the command exceeds the given timeout
         """
-        result = self.container.exec_run(command, environment=env)
-        return ExecResult(result.output, result.exit_code)
+        exec_id = self.client.api.exec_create(
+            self.container.id, cmd=command, environment=env
+        )["Id"]
+        stream = self.client.api.exec_start(exec_id, stream=True)
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        tail: deque[bytes] = deque()
+        tail_size = 0
+
+        with open(os.path.join(self.log_dir, "exec.log"), "ab") as log_file:
+            log_file.write(f"$ {command}\n".encode())
+            for chunk in stream:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(
+                        f"Command timed out after {timeout} seconds: {command}"
+                    )
+
+                log_file.write(chunk)
+                tail.append(chunk)
+                tail_size += len(chunk)
+                if tail_bytes is not None:
+                    while len(tail) > 1 and tail_size - len(tail[0]) >= tail_bytes:
+                        tail_size -= len(tail.popleft())
+
+        exit_code = self.client.api.exec_inspect(exec_id)["ExitCode"]
+        return ExecResult(b"".join(tail), exit_code)
@@ -14,12 +14,21 @@ Typical usage:
 """
 
 from datasets import load_dataset
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
 import subprocess
 import json
 import logging
 import docker
 import argparse
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a regular dependency
+    orjson = None
 
 from .benchmark import Benchmark
 from .swe_bench_instance import SWEBenchInstance
@@ -35,6 +44,20 @@ DATASET_NAME = "princeton-nlp/SWE-bench_Verified"
 SPLIT = "test"
 
 
+@functools.lru_cache(maxsize=1)
+def _dataset_by_id() -> dict[str, dict]:
+    """Load the SWE-bench dataset and index it by instance_id.
+
+    The dataset decode is expensive, so the result is memoized for the
+    lifetime of the process and lookups become O(1) dict access.
+
+    Returns:
+        dict[str, dict]: Mapping from instance_id to the raw dataset row
+    """
+    dataset = load_dataset(DATASET_NAME, split=SPLIT)
+    return {row["instance_id"]: row for row in dataset}
+
+
 def evaluate_trial(instance_id: str, results_path: str) -> None:
     """Evaluate a specific trial's results.
 
@@ -42,18 +65,14 @@ def evaluate_trial(instance_id: str, results_path: str) -> None:
         instance_id: The ID of the instance to evaluate
         results_path: Path to the directory containing the trial results and prediction.json
     """
-    # Load the dataset to get the instance
-    dataset = load_dataset(DATASET_NAME, split=SPLIT)
-    dataset_list = list(dataset)
-    instance_items = [
-        item for item in dataset_list if item["instance_id"] == instance_id
-    ]
-    if not instance_items:
+    # Look up the instance in the cached dataset index
+    instance_item = _dataset_by_id().get(instance_id)
+    if instance_item is None:
         logging.error(f"Instance {instance_id} not found in dataset")
         return
 
     # Create SWEBenchInstance
-    instance = SWEBenchInstance.from_dataset([instance_items[0]])[0]
+    instance = SWEBenchInstance.from_dataset([instance_item])[0]
 
     # Create trial
     trial = Trial(instance, instance_id, results_path)
@@ -195,6 +214,12 @@ def main():
         action="store_true",
         help="Print paths that would be removed without actually removing them",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent image pulls and trials",
+    )
     args = parser.parse_args()
 
     # If evaluating a specific trial
@@ -221,34 +246,32 @@ def main():
         remove_results(results_dir, lambda r: not r.get("success", False), args.dry_run)
         return
 
-    # Load the dataset
-    dataset = load_dataset(DATASET_NAME, split=SPLIT)
+    # Load the dataset, sorted natively on the Arrow column instead of
+    # materializing every row into a Python list just to sort it
+    dataset = load_dataset(DATASET_NAME, split=SPLIT).sort("instance_id")
     logging.info(f"Total items in test split: {len(dataset)}\n")
     predictions = []
 
-    # Convert dataset to list and sort by instance_id
-    dataset_list = list(dataset)
-    dataset_list.sort(key=lambda x: x["instance_id"])
-
     # Filter dataset based on command line arguments
     raw_dataset_items = []
     if args.instance:
-        # Find the specific instance
-        instance_items = [
-            item for item in dataset_list if item["instance_id"] == args.instance
-        ]
-        if not instance_items:
+        # Find the specific instance via the cached dataset index
+        instance_item = _dataset_by_id().get(args.instance)
+        if instance_item is None:
             logging.error(f"Instance {args.instance} not found in dataset")
             return
-        raw_dataset_items = instance_items
+        raw_dataset_items = [instance_item]
         logging.info(f"Running single instance: {args.instance}")
     else:
-        # Get the first 2 items for each repo from the dataset
-        all_repos = list(set([item["repo"] for item in dataset]))
-        for repo in all_repos:
-            repo_items = [item for item in dataset_list if item["repo"] == repo]
-            raw_dataset_items.extend(repo_items[:2])
-        logging.info(f"Running first 2 items from {len(all_repos)} repositories")
+        # Get the first 2 items for each repo in a single pass over the
+        # sorted dataset, materializing only the rows we keep
+        buckets: dict[str, list] = defaultdict(list)
+        for item in dataset:
+            bucket = buckets[item["repo"]]
+            if len(bucket) < 2:
+                bucket.append(item)
+        raw_dataset_items = [item for bucket in buckets.values() for item in bucket]
+        logging.info(f"Running first 2 items from {len(buckets)} repositories")
 
     dataset_items = SWEBenchInstance.from_dataset(raw_dataset_items)
 
@@ -266,9 +289,23 @@ def main():
     ]
 
     docker_client = docker.from_env()
-    for image in images_to_pull:
+
+    # Skip images that are already present locally
+    local_tags = {
+        tag for image in docker_client.images.list() for tag in image.tags
+    }
+    images_to_pull = [image for image in images_to_pull if image not in local_tags]
+
+    def pull_image(image: str) -> None:
         logging.info(f"Pulling image {image}")
-        docker_client.images.pull(image)
+        try:
+            docker_client.images.pull(image)
+        except Exception as e:
+            logging.error(f"Failed to pull image {image}: {e}")
+
+    # Pulls are independent and network-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(pull_image, images_to_pull))
 
     # instance_ids = [item.instance_id for item in dataset_items]
     # prepare_images(
@@ -292,10 +329,7 @@ def main():
     logging.info(f"Benchmark name: {benchmark_name}\n")
     logging.info(f"Output path: {output_path}\n")
 
-    while result := benchmark.run_next_trial():
-        logging.info(
-            f"Done running trial {result.instance.instance_id}: {result.error or 'Success'}"
-        )
+    benchmark.run_all_trials(max_workers=args.workers)
 
     for name, result in benchmark.results.items():
         if result.failed():
@@ -310,16 +344,23 @@ def main():
 
         predictions.append(prediction)
 
-    with open("predictions.jsonl", "w") as f:
-        for prediction in predictions:
-            f.write(json.dumps(prediction) + "\n")
-
-    with open("swe_bench_results.json", "w") as f:
-        # Convert results to a dictionary of serializable results
-        serializable_results = {
-            name: result.to_dict() for name, result in benchmark.results.items()
-        }
-        json.dump(serializable_results, f, indent=2)
+    # Serialize all predictions up front and write them in one call
+    if orjson is not None:
+        lines = [orjson.dumps(prediction) for prediction in predictions]
+    else:
+        lines = [json.dumps(prediction).encode() for prediction in predictions]
+    Path("predictions.jsonl").write_bytes(b"".join(line + b"\n" for line in lines))
+
+    # Convert results to a dictionary of serializable results; keep the
+    # indentation here since this file is meant for humans
+    serializable_results = {
+        name: result.to_dict() for name, result in benchmark.results.items()
+    }
+    if orjson is not None:
+        results_payload = orjson.dumps(serializable_results, option=orjson.OPT_INDENT_2)
+    else:
+        results_payload = json.dumps(serializable_results, indent=2).encode()
+    Path("swe_bench_results.json").write_bytes(results_payload)
 
 
 if __name__ == "__main__":
@@ -13,21 +13,24 @@ Typical usage:
     test_cmd = instance.test_cmd
 """
 
-from dataclasses import dataclass, asdict
 from typing import Any
 import json
+
+import msgspec
 from swebench.harness.test_spec.python import get_test_directives
 from swebench.harness.constants import (
     MAP_REPO_VERSION_TO_SPECS,
 )
 
 
-@dataclass
-class SWEBenchInstance:
+class SWEBenchInstance(msgspec.Struct):
     """Represents a single test case from the SWE-bench dataset.
 
     This class is our internal representation of a SWE-bench test case,
     which is converted from the dataset's SWEbenchInstance format.
+
+    Defined as a msgspec.Struct so result files can be decoded straight
+    into typed instances without an intermediate dict.
     """
 
     """Represents a single test case from the SWE-bench dataset.
@@ -73,7 +76,7 @@ class SWEBenchInstance:
                            suitable for JSON serialization. All fields are
                            included in their native Python types.
         """
-        return asdict(self)
+        return msgspec.to_builtins(self)
 
     @property
     def instance_image_key(self) -> str:
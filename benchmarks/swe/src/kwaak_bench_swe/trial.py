@@ -22,9 +22,10 @@ import logging
 import os
 import json
 import subprocess
-from dataclasses import dataclass, asdict
 from typing import Any
 
+import msgspec
+
 from .swe_bench_instance import SWEBenchInstance
 from .docker_instance import DockerInstance
 
@@ -40,13 +41,15 @@ from swebench.harness.constants import (
 )
 
 
-@dataclass
-class TrialResult:
+class TrialResult(msgspec.Struct):
     """Represents the outcome of a trial execution.
 
     This class encapsulates all information about a trial's execution,
     including success/failure status, error messages, and the generated patch.
 
+    Defined as a msgspec.Struct so result.json files decode directly into
+    typed results (with the nested instance hydrated in the same pass).
+
     Attributes:
         instance: The SWE-bench instance that was tested
         run_failed: Whether there was an error during execution
@@ -75,18 +78,11 @@ class TrialResult:
     def to_dict(self) -> dict[str, Any]:
         """Convert the TrialResult to a dictionary for JSON serialization.
 
-        This method handles nested objects by checking for and using their
-        to_dict methods when available.
-
         Returns:
             dict[str, Any]: A JSON-serializable dictionary containing all trial
-                           result data, including nested objects
+                           result data, including the nested instance
         """
-        result = asdict(self)
-        # Convert the SWEBenchInstance to a dict if it has a to_dict method
-        if hasattr(self.instance, "to_dict"):
-            result["instance"] = self.instance.to_dict()
-        return result
+        return msgspec.to_builtins(self)
 
 
 class Trial:
@@ -182,9 +178,11 @@ class Trial:
             self.install_agent()
             self.run_agent()
 
-            # Get the changes made by the agent
-            diff = self.container.exec(
-                f"git diff {initial_git_ref} HEAD"
+            # Get the changes made by the agent; --binary keeps the patch
+            # byte-exact so SWE-bench can reapply it even when the agent
+            # touched non-text files
+            diff = self._run_git(
+                f"git diff --binary {initial_git_ref} HEAD"
             ).output.decode()
 
             prediction = {
@@ -232,37 +230,43 @@ class Trial:
         2. Creates a commit with the current state
         3. Returns the commit hash
 
+        All git commands are fused into one shell invocation so only a
+        single Docker exec round-trip happens instead of five; each exec
+        costs 50-150ms of daemon/runc overhead regardless of the git work.
+
         Returns:
             str: The hash of the created commit
 
         Raises:
             Exception: If git operations fail
         """
-        # Configure git user
-        result = self.container.exec("git config user.name 'agent-test-harness'")
-        if result.exit_code != 0:
-            raise Exception(f"Failed to configure git user name: {result.output}")
-
-        result = self.container.exec(
-            "git config user.email 'agent-test-harness@bosun.ai'"
+        result = self._run_git(
+            "git config user.name 'agent-test-harness'",
+            "git config user.email 'agent-test-harness@bosun.ai'",
+            "git add .",
+            # git commit may return non-zero even on success (nothing to commit)
+            "{ git commit -a -m 'benchmark-head' || true; }",
+            # The trailing rev-parse fails if there really was no commit
+            "git rev-parse HEAD",
         )
         if result.exit_code != 0:
-            raise Exception(f"Failed to configure git user email: {result.output}")
+            raise Exception(f"Failed to establish initial git ref: {result.output}")
 
-        # Create initial commit - git commit may return non-zero even on success
-        self.container.exec("git add .")
-        result = self.container.exec("git commit -a -m 'benchmark-head'")
-        if result.exit_code != 0:
-            logging.info(
-                f"Failed to create initial commit (exit code: {result.exit_code}): {result.output}"
-            )
+        return result.output.decode().splitlines()[-1].strip()
 
-        # Get commit hash - this will fail if there really was no commit
-        result = self.container.exec("git rev-parse HEAD")
-        if result.exit_code != 0:
-            raise Exception(f"Failed to get commit hash: {result.output}")
+    def _run_git(self, *commands: str):
+        """Run a batch of git commands in a single container exec.
+
+        Chaining the commands with && means each batch pays one Docker exec
+        round-trip instead of one per git invocation.
 
-        return result.output.decode().strip()
+        Args:
+            *commands: Shell commands to chain; execution stops on failure
+
+        Returns:
+            ExecResult: Combined output and exit code of the batch
+        """
+        return self.container.exec(f'sh -c "{" && ".join(commands)}"')
 
     def install_agent(self) -> None:
         """Install the Kwaak agent in the test environment.
@@ -276,6 +280,12 @@ class Trial:
         Raises:
             subprocess.CalledProcessError: If any build step fails
         """
+        # A container that already carries the agent (a reused container or
+        # an image with kwaak baked in) skips the whole build-and-copy path
+        # for the cost of a single exec
+        if self.container.exec("test -x /usr/local/bin/kwaak").exit_code == 0:
+            return
+
         # agent is located at the root of the git repository of the cwd
         agent_root = (
             subprocess.check_output(["git", "rev-parse", "--show-toplevel"])
@@ -352,77 +362,58 @@ class Trial:
         self.invoke_kwaak()
 
     def invoke_kwaak(self):
-        import threading
-        import queue
-        import time
-
         logging.info("Invoking kwaak")
         openai_api_key = os.environ["OPENAI_API_KEY"]
         prompt = self.render_prompt()
 
-        # Queue to store the result from the thread
-        result_queue = queue.Queue()
-
         # Split on "/" then get tail
         project_name = self.item.repo.split("/")[-1]
 
-        def run_kwaak():
-            try:
-                result = self.container.exec(
-                    "/swe/kwaak.sh",
-                    env={
-                        "PROMPT": prompt,
-                        "OPENAI_API_KEY": openai_api_key,
-                        "RUST_LOG": "debug",
-                        "RUST_BACKTRACE": "1",
-                        "KWAAK__PROJECT_NAME": project_name,
-                    },
-                )
-                result_queue.put(result)
-            except Exception as e:
-                result_queue.put(e)
-
-        # Start the thread
-        thread = threading.Thread(target=run_kwaak)
-        thread.daemon = (
-            True  # Make thread daemon so it will be killed when main thread exits
-        )
-        thread.start()
-
-        # Wait for the thread with timeout
         minutes = 60
-        timeout = minutes * 60
-        timeout_time = time.time() + timeout
 
-        agent_result_path = os.path.join(self.results_dir, "agent_result.txt")
+        try:
+            # The exec itself enforces the deadline, so no watcher thread or
+            # polling loop is needed. The full log is tee'd to /swe/kwaak.log
+            # inside the container, so a bounded tail is enough here.
+            result = self.container.exec(
+                "/swe/kwaak.sh",
+                env={
+                    "PROMPT": prompt,
+                    "OPENAI_API_KEY": openai_api_key,
+                    "RUST_LOG": "debug",
+                    "RUST_BACKTRACE": "1",
+                    "KWAAK__PROJECT_NAME": project_name,
+                },
+                tail_bytes=64 * 1024,
+                timeout=minutes * 60,
+            )
+        except Exception as e:
+            self._write_agent_result(f"Error: {str(e)}")
+            return
+
+        # The tail trims at byte granularity and can start mid-UTF-8
+        # sequence; .text decodes with errors="replace" so a mangled first
+        # character never turns a finished run into a decode failure
+        self._write_agent_result(f"{result.text}\nExit Code: {result.exit_code}")
+
+    def _write_agent_result(self, content: str) -> None:
+        """Write the agent result artifact in a single open/write/close.
+
+        Raw os calls skip the buffered-file machinery for this one-shot
+        write of a small payload.
 
+        Args:
+            content: Text to record in agent_result.txt
+        """
+        fd = os.open(
+            os.path.join(self.results_dir, "agent_result.txt"),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
         try:
-            # Wait for the thread to complete or timeout
-            while thread.is_alive() and time.time() < timeout_time:
-                thread.join(1.0)  # Check every second
-
-            if thread.is_alive():
-                # Timeout occurred
-                with open(agent_result_path, "w") as f:
-                    f.write(f"Timeout Error {minutes} minutes")
-                return
-
-            # Get the result if thread completed
-            result = result_queue.get_nowait()
-            if isinstance(result, Exception):
-                # Handle any exceptions that occurred in the thread
-                with open(agent_result_path, "w") as f:
-                    f.write(f"Error: {str(result)}")
-            else:
-                # Write successful result
-                with open(agent_result_path, "w") as f:
-                    f.write(result.output.decode())
-                    f.write(f"\nExit Code: {result.exit_code}")
-
-        except queue.Empty:
-            # This shouldn't happen since we already checked thread.is_alive()
-            with open(agent_result_path, "w") as f:
-                f.write("Unexpected error: No result from thread")
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
 
     def render_prompt(self):
         return (
@@ -1,30 +1,114 @@
 """Common pytest fixtures for the test suite."""
 
+import functools
+import os
+
+import docker
 import pytest
-from pathlib import Path
+
+# Route temp dirs (and thus temp_results_dir) to tmpfs when available, so
+# result-file I/O in tests runs at memory speed instead of paying overlayfs
+# copy-up costs on Docker-backed CI runners. Must happen at import time,
+# before pytest resolves its temp root.
+if os.path.isdir("/dev/shm"):
+    os.environ.setdefault("TMPDIR", "/dev/shm")
 from datasets import load_dataset
 from kwaak_bench_swe.swe_bench_instance import SWEBenchInstance
 from kwaak_bench_swe.docker_instance import DockerInstance
 
 
+@functools.lru_cache(maxsize=1)
+def _docker_available() -> bool:
+    """Probe the Docker daemon once per process."""
+    try:
+        docker.from_env(timeout=5).ping()
+        return True
+    except Exception:
+        return False
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _fake_openai_key():
+    """Provide a dummy OPENAI_API_KEY for the whole session.
+
+    Cheaper than per-test mocker.patch.dict, which snapshots and restores
+    the entire environ dict at every teardown. Tests that need the key
+    absent can monkeypatch.delenv it locally.
+    """
+    os.environ.setdefault("OPENAI_API_KEY", "test-key")
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _skip_without_docker(request):
+    """Skip docker-marked tests up front when no daemon is reachable.
+
+    One cached ping replaces per-test connect timeouts or late container
+    creation failures on runners without Docker.
+    """
+    if request.node.get_closest_marker("docker") and not _docker_available():
+        pytest.skip("Docker daemon unavailable")
+
+
 @pytest.fixture
-def temp_results_dir(tmp_path):
-    """Create a temporary directory for test results."""
-    results_dir = tmp_path / "results"
-    results_dir.mkdir()
-    return str(results_dir)
+def temp_results_dir(tmp_path_factory):
+    """Create a temporary directory for test results.
 
+    Function-scoped on purpose: tests rely on a pristine directory.
+    tmp_path_factory hands each xdist worker its own numbered subtree,
+    so parallel workers never collide on results paths.
+    """
+    return str(tmp_path_factory.mktemp("results"))
 
-DATASET = load_dataset("princeton-nlp/SWE-bench_Verified", split="test")
-INSTANCE_ITEM = next(
-    item for item in DATASET if item["instance_id"] == "psf__requests-1142"
-)
+
+@pytest.fixture(scope="session")
+def dataset_by_id():
+    """Load the SWE-bench dataset once per session, indexed by instance_id."""
+    dataset = load_dataset("princeton-nlp/SWE-bench_Verified", split="test")
+    return {row["instance_id"]: row for row in dataset}
+
+
+@pytest.fixture(scope="session")
+def mock_swe_instance(dataset_by_id):
+    """Create a mock SWE-bench instance for testing using psf/requests-1142 from the dataset.
+
+    Session-scoped: tests treat the instance as read-only, so the dataset
+    lookup and construction happen once per test run.
+    """
+    return SWEBenchInstance.from_dataset([dataset_by_id["psf__requests-1142"]])[0]
+
+
+@pytest.fixture(scope="session")
+def shared_container(mock_swe_instance, tmp_path_factory):
+    """Start one real Docker container shared by the whole session.
+
+    Container startup dominates integration test wall time, so the tests
+    reuse a single container and reset its git state between tests instead
+    of each paying the image check / create / start cost.
+
+    Session fixtures are set up before the function-scoped marker check
+    runs, so guard here too: without it, a missing daemon turns every
+    dependent test into a setup ERROR instead of a skip.
+    """
+    if not _docker_available():
+        pytest.skip("Docker daemon unavailable")
+    instance = DockerInstance(
+        mock_swe_instance, str(tmp_path_factory.mktemp("shared-container"))
+    )
+    instance.run("shared")
+    head = instance.exec("git -C /testbed rev-parse HEAD").output.decode().strip()
+    yield instance, head
+    instance.cleanup()
 
 
 @pytest.fixture
-def mock_swe_instance():
-    """Create a mock SWE-bench instance for testing using psf/requests-1142 from the dataset."""
-    return SWEBenchInstance.from_dataset([INSTANCE_ITEM])[0]
+def reset_container(shared_container):
+    """Reset the shared container's repository to its pristine state."""
+    instance, head = shared_container
+    instance.exec(
+        f'sh -c "git -C /testbed reset --hard {head} && git -C /testbed clean -fdx"'
+    )
+    return instance
 
 
 @pytest.fixture
@@ -35,7 +119,7 @@ def mock_docker_instance(mock_swe_instance, temp_results_dir, mocker):
     mock_container.exec_run.return_value.output = b"test output"
     mock_container.exec_run.return_value.exit_code = 0
 
-    mocker.patch("docker.from_env")
+    mocker.patch("kwaak_bench_swe.docker_instance._get_client")
 
     instance = DockerInstance(mock_swe_instance, temp_results_dir)
     instance.container = mock_container
@@ -92,3 +92,34 @@ def test_benchmark_next_run(mock_swe_instance, temp_results_dir):
     )
     benchmark.results[next_run["run_name"]] = result
     assert benchmark.next_run() is None
+
+
+def test_benchmark_run_all_trials(mock_swe_instance, temp_results_dir, mocker):
+    """Test that run_all_trials records results and drains the pending queue."""
+    benchmark = Benchmark("test-bench", [mock_swe_instance], temp_results_dir)
+
+    result = TrialResult(instance=mock_swe_instance, success=True, patch="test patch")
+    # Class-level patch: Benchmark defines __slots__
+    mocker.patch.object(Benchmark, "_run_trial", return_value=result)
+
+    completed = benchmark.run_all_trials(max_workers=2)
+
+    assert completed == [result]
+    assert benchmark.results[f"{mock_swe_instance.instance_id}-1"] is result
+    assert benchmark.next_run() is None
+
+
+def test_benchmark_run_all_trials_trial_raises(
+    mock_swe_instance, temp_results_dir, mocker
+):
+    """Test that a trial failing before producing a result doesn't propagate."""
+    benchmark = Benchmark("test-bench", [mock_swe_instance], temp_results_dir)
+
+    mocker.patch.object(
+        Benchmark, "_run_trial", side_effect=RuntimeError("daemon unavailable")
+    )
+
+    completed = benchmark.run_all_trials(max_workers=2)
+
+    assert completed == []
+    assert f"{mock_swe_instance.instance_id}-1" not in benchmark.results
@@ -7,6 +7,8 @@ from docker import from_env as docker_from_env
 
 from kwaak_bench_swe.docker_instance import DockerInstance, ExecResult
 
+pytestmark = pytest.mark.docker
+
 
 @pytest.fixture(autouse=True)
 def cleanup_containers():
@@ -68,7 +70,7 @@ def test_docker_instance_run(mock_swe_instance, temp_results_dir):
         # Test basic command execution
         result = instance.exec("echo 'hello world'")
         assert result.exit_code == 0
-        assert result.output.decode().strip() == "hello world"
+        assert result.output.strip() == b"hello world"
     finally:
         instance.cleanup()
 
@@ -86,7 +88,7 @@ def test_docker_instance_write_file(mock_swe_instance, temp_results_dir):
         # Verify file exists and has correct content
         result = instance.exec("cat /testbed/test.txt")
         assert result.exit_code == 0
-        assert result.output.decode().strip() == test_content
+        assert result.output.strip() == test_content.encode()
     finally:
         instance.cleanup()
 
@@ -100,7 +102,7 @@ def test_docker_instance_exec(mock_swe_instance, temp_results_dir):
         # Test successful command
         result = instance.exec("echo 'success'")
         assert result.exit_code == 0
-        assert result.output.decode().strip() == "success"
+        assert result.output.strip() == b"success"
 
         # Test failed command
         result = instance.exec("nonexistent-command")
@@ -1,28 +1,47 @@
 """Unit tests for the trial module."""
 
+import itertools
 import os
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 from kwaak_bench_swe.trial import Trial, TrialResult
 from swebench.harness.test_spec.test_spec import TestSpec
 
-
-def test_trial_result_failed():
+# Frozen exec-result stubs shared by all tests. Mock.__init__ allocates a
+# pile of bookkeeping dicts per instance; these return values are read-only,
+# so one SimpleNamespace each, built at import time, is enough.
+OK = SimpleNamespace(output=b"test output\n", exit_code=0)
+GITHASH = SimpleNamespace(
+    output=b"[master abc1234] benchmark-head\ntest-hash\n", exit_code=0
+)
+PATCH_FAIL = SimpleNamespace(output=b"Test error", exit_code=1)
+
+# Substrings expected in the single batched git exec issued by
+# establish_initial_git_ref; order inside the batch is an implementation
+# detail and deliberately not asserted
+EXPECTED_GIT_COMMANDS = (
+    "git config user.name",
+    "git config user.email",
+    "git add",
+    "git commit",
+    "git rev-parse",
+)
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({}, False),
+        ({"run_failed": True}, True),
+        ({"validation_failed": True}, True),
+        ({"error": "Test error"}, True),
+    ],
+)
+def test_trial_result_failed(kwargs, expected):
     """Test the failed() method of TrialResult."""
-    # Test with no failures
-    result = TrialResult(instance=None)
-    assert not result.failed()
-
-    # Test with run failure
-    result = TrialResult(instance=None, run_failed=True)
-    assert result.failed()
-
-    # Test with validation failure
-    result = TrialResult(instance=None, validation_failed=True)
-    assert result.failed()
-
-    # Test with error
-    result = TrialResult(instance=None, error="Test error")
-    assert result.failed()
+    assert TrialResult(instance=None, **kwargs).failed() is expected
 
 
 def test_trial_result_to_dict(mock_swe_instance):
@@ -53,28 +72,23 @@ def test_trial_initialization(mock_swe_instance, temp_results_dir):
 
 
 def test_trial_establish_git_ref(
-    mock_swe_instance, temp_results_dir, mock_docker_instance, mocker
+    mock_swe_instance, temp_results_dir, mock_docker_instance
 ):
     """Test establishing initial git reference."""
     trial = Trial(mock_swe_instance, "test-1", temp_results_dir)
     trial.container = mock_docker_instance.container
 
-    # Mock successful git command
-    mock_docker_instance.container.exec.return_value = mocker.Mock(
-        output=b"test-hash\n", exit_code=0
-    )
+    # Mock the batched git command; the commit hash is the last output line
+    mock_docker_instance.container.exec.return_value = GITHASH
 
     ref = trial.establish_initial_git_ref()
     assert ref == "test-hash"
 
-    # Verify git commands were called
+    # All git commands are fused into a single exec round-trip
     calls = mock_docker_instance.container.exec.call_args_list
-    assert len(calls) == 5  # git config name, email, commit, add, and rev-parse
-    assert "git config user.name" in calls[0].args[0]
-    assert "git config user.email" in calls[1].args[0]
-    assert "git add" in calls[2].args[0]
-    assert "git commit" in calls[3].args[0]
-    assert "git rev-parse" in calls[4].args[0]
+    assert len(calls) == 1
+    command = calls[0].args[0]
+    assert all(expected in command for expected in EXPECTED_GIT_COMMANDS)
 
 
 def test_trial_run(mock_swe_instance, temp_results_dir, mock_docker_instance, mocker):
@@ -82,30 +96,23 @@ def test_trial_run(mock_swe_instance, temp_results_dir, mock_docker_instance, mo
     trial = Trial(mock_swe_instance, "test-1", temp_results_dir)
     trial.container = mock_docker_instance.container
 
-    # Mock environment variables
-    mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-
-    # Mock successful container execution
-    exec_mock = mocker.Mock()
-    exec_mock.side_effect = [
-        mocker.Mock(output=b"test output\n", exit_code=0),  # test patch
-        mocker.Mock(output=b"test output\n", exit_code=0),  # git config
-        mocker.Mock(output=b"test output\n", exit_code=0),  # git add
-        mocker.Mock(output=b"test output\n", exit_code=0),  # git commit
-        mocker.Mock(output=b"test output\n", exit_code=0),  # git rev-parse
-    ]
+    # Mock successful container execution; the frozen stub repeated lazily
+    # is much cheaper than allocating a Mock per call
+    exec_mock = mocker.Mock(side_effect=itertools.repeat(OK))
     mock_docker_instance.container.exec = exec_mock
 
-    # Mock methods
-    mocker.patch.object(trial, "establish_initial_git_ref", return_value="test-hash")
-    mocker.patch.object(trial, "install_agent")
-    mocker.patch.object(trial, "run_agent")
-    mocker.patch.object(
+    # Mock the pipeline steps in one patch.multiple pass instead of four
+    # separately bookkept patch.object calls
+    mocks = mocker.patch.multiple(
         trial,
-        "evaluate_results",
-        return_value=TrialResult(
-            instance=mock_swe_instance, success=True, patch="test patch"
-        ),
+        establish_initial_git_ref=mocker.DEFAULT,
+        install_agent=mocker.DEFAULT,
+        run_agent=mocker.DEFAULT,
+        evaluate_results=mocker.DEFAULT,
+    )
+    mocks["establish_initial_git_ref"].return_value = "test-hash"
+    mocks["evaluate_results"].return_value = TrialResult(
+        instance=mock_swe_instance, success=True, patch="test patch"
     )
 
     result = trial.run()
@@ -116,16 +123,14 @@ def test_trial_run(mock_swe_instance, temp_results_dir, mock_docker_instance, mo
 
 
 def test_trial_run_with_error(
-    mock_swe_instance, temp_results_dir, mock_docker_instance, mocker
+    mock_swe_instance, temp_results_dir, mock_docker_instance
 ):
     """Test trial run with an error during execution."""
     trial = Trial(mock_swe_instance, "test-1", temp_results_dir)
     trial.container = mock_docker_instance.container
 
     # Mock container.exec to fail when applying patch
-    mock_docker_instance.container.exec.return_value = mocker.Mock(
-        output=b"Test error", exit_code=1
-    )
+    mock_docker_instance.container.exec.return_value = PATCH_FAIL
 
     result = trial.run()
     assert isinstance(result, TrialResult)
@@ -133,15 +138,25 @@ def test_trial_run_with_error(
     assert result.error == "Patch failed: Test error"
 
 
+def test_trial_install_agent_cached(
+    mock_swe_instance, temp_results_dir, mock_docker_instance
+):
+    """Test that install_agent short-circuits when kwaak is already present."""
+    trial = Trial(mock_swe_instance, "test-1", temp_results_dir)
+    trial.container = mock_docker_instance.container
+
+    # The presence probe succeeds, so no build or copy step should run
+    mock_docker_instance.container.exec.return_value = OK
+
+    trial.install_agent()
+
+    assert mock_docker_instance.container.exec.call_count == 1
+
+
 def test_trial_invoke_kwaak_timeout(
     mock_swe_instance, temp_results_dir, mock_docker_instance, mocker
 ):
     """Test that invoke_kwaak handles timeouts properly."""
-    import time
-
-    # Mock environment variables
-    mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-
     trial = Trial(mock_swe_instance, "test-1", temp_results_dir)
     trial.container = mock_docker_instance.container
 
@@ -154,8 +169,9 @@ def test_trial_invoke_kwaak_timeout(
     # Run invoke_kwaak
     trial.invoke_kwaak()
 
+    # The timeout is enforced by the exec itself; no polling loop remains
+    assert mock_docker_instance.container.exec.call_count == 1
+
     # Check that timeout message was written to agent_result.txt
     agent_result_path = os.path.join(temp_results_dir, "agent_result.txt")
-    with open(agent_result_path, "r") as f:
-        content = f.read()
-        assert content == "Error: Command timed out"
+    assert Path(agent_result_path).read_bytes() == b"Error: Command timed out"